@@ -24,37 +24,116 @@ uploaded_file = st.sidebar.file_uploader(
     help="Upload a file containing crime data with the specified columns."
 )
 
+# Expected columns and the type each one is converted to
+COLUMN_TYPES = {
+    'INCIDENT_NUMBER': 'str',
+    'OFFENSE_CODE': 'int64',
+    'OFFENSE_CODE_GROUP': 'str',
+    'OFFENSE_DESCRIPTION': 'str',
+    'DISTRICT': 'str',
+    'REPORTING_AREA': 'str',
+    'SHOOTING': 'str',
+    'OCCURRED_ON_DATE': 'datetime64',
+    'YEAR': 'int64',
+    'MONTH': 'int64',
+    'DAY_OF_WEEK': 'str',
+    'HOUR': 'int64',
+    'UCR_PART': 'str',
+    'STREET': 'str',
+    'Lat': 'float64',
+    'Long': 'float64',
+    'Location': 'str',
+}
+
+# Columns that must have a value, rows without one are rejected.
+# Integer columns cannot hold missing values, so they are listed as well.
+NON_EMPTY_COLUMNS = ['OFFENSE_CODE', 'DISTRICT', 'YEAR', 'MONTH', 'HOUR', 'UCR_PART']
+
+# Function to check that all expected columns are present
+def check_columns(columns):
+    missing = [col for col in COLUMN_TYPES if col not in columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+# Function to read the uploaded file
+def read_file(uploaded_file):
+    if uploaded_file.name.endswith('.csv'):
+        # Parse only the header first so missing columns fail before the full read
+        check_columns(pd.read_csv(uploaded_file, nrows=0).columns)
+        uploaded_file.seek(0)
+        # Read expected columns as text, conversion happens in validate_data
+        return pd.read_csv(uploaded_file, dtype={col: str for col in COLUMN_TYPES})
+    elif uploaded_file.name.endswith('.json'):
+        df = pd.read_json(uploaded_file)
+        check_columns(df.columns)
+        return df
+    raise ValueError(f"Unsupported file type: {uploaded_file.name}")
+
+# Function to convert data types and separate rows that cannot be converted
+def validate_data(df):
+    # read_json keeps empty strings, treat them as missing like read_csv does
+    df = df.replace({col: r'^\s*$' for col in COLUMN_TYPES}, np.nan, regex=True)
+
+    converted = {}
+    failures = {}
+    for col, dtype in COLUMN_TYPES.items():
+        if dtype == 'str':
+            converted[col] = df[col].astype(str)
+            continue
+        if dtype == 'datetime64':
+            # Parsing as UTC keeps values with an offset from aborting the load,
+            # they are rejected since the date filter only handles naive timestamps
+            values = pd.to_datetime(df[col], errors='coerce', format='mixed', utc=True)
+            has_offset = df[col].astype(str).str.strip().str.contains(
+                r'(?:Z|[+-]\d{2}:?\d{2})$', na=False
+            )
+            values = values.dt.tz_localize(None).mask(has_offset)
+        else:
+            values = pd.to_numeric(df[col], errors='coerce')
+        failed = values.isna()
+        if dtype == 'int64':
+            # Fractional values cannot be stored as integers
+            failed |= values % 1 != 0
+        # Missing values are reported separately through NON_EMPTY_COLUMNS
+        failed &= df[col].notna()
+        converted[col] = values
+        failures[col] = failed
+
+    failures = pd.DataFrame(failures, index=df.index)
+    missing = df[NON_EMPTY_COLUMNS].isna()
+    bad_rows = failures.any(axis=1) | missing.any(axis=1)
+
+    # Keep rejected rows as uploaded and note which columns failed
+    rejects = df[bad_rows].copy()
+    rejected_failures = pd.concat(
+        [missing.add_suffix(' missing'), failures], axis=1
+    )[bad_rows]
+    rejects['REJECT_REASON'] = rejected_failures.dot(
+        rejected_failures.columns + ', '
+    ).str.rstrip(', ')
+
+    df = df.assign(**converted)[~bad_rows]
+    for col, dtype in COLUMN_TYPES.items():
+        if dtype in ('int64', 'float64'):
+            df[col] = df[col].astype(dtype)
+
+    report = {
+        'coercion_counts': failures.sum().astype(int).to_dict(),
+        'missing_counts': missing.sum().astype(int).to_dict(),
+        'rejects': rejects,
+    }
+    return df, report
+
+# Function to load data and return it together with the validation report
+def load_data_with_report(uploaded_file):
+    if uploaded_file is not None:
+        return validate_data(read_file(uploaded_file))
+    return None, None
+
 # Function to load data based on file type
 def load_data(uploaded_file):
-    if uploaded_file is not None:
-        if uploaded_file.name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file)
-        elif uploaded_file.name.endswith('.json'):
-            df = pd.read_json(uploaded_file)
-        
-        # Convert data types according to specifications
-        df['INCIDENT_NUMBER'] = df['INCIDENT_NUMBER'].astype(str)
-        df['OFFENSE_CODE'] = df['OFFENSE_CODE'].astype('int64')
-        df['OFFENSE_CODE_GROUP'] = df['OFFENSE_CODE_GROUP'].astype(str)
-        df['OFFENSE_DESCRIPTION'] = df['OFFENSE_DESCRIPTION'].astype(str)
-        df = df.dropna(subset=['DISTRICT'])
-        df['DISTRICT'] = df['DISTRICT'].astype(str)
-        df['REPORTING_AREA'] = df['REPORTING_AREA'].astype(str)
-        df['SHOOTING'] = df['SHOOTING'].astype(str)
-        df['OCCURRED_ON_DATE'] = pd.to_datetime(df['OCCURRED_ON_DATE'])
-        df['YEAR'] = df['YEAR'].astype('int64')
-        df['MONTH'] = df['MONTH'].astype('int64')
-        df['DAY_OF_WEEK'] = df['DAY_OF_WEEK'].astype(str)
-        df['HOUR'] = df['HOUR'].astype('int64')
-        df = df.dropna(subset=['UCR_PART'])
-        df['UCR_PART'] = df['UCR_PART'].astype(str)
-        df['STREET'] = df['STREET'].astype(str)
-        df['Lat'] = df['Lat'].astype('float64')
-        df['Long'] = df['Long'].astype('float64')
-        df['Location'] = df['Location'].astype(str)
-        
-        return df
-    return None
+    df, _ = load_data_with_report(uploaded_file)
+    return df
 
 # Function to create gauge chart
 def create_gauge(value, title, color):
@@ -81,8 +160,34 @@ def create_gauge(value, title, color):
 
 # Load data if file is uploaded
 if uploaded_file is not None:
-    crime_data = load_data(uploaded_file)
+    try:
+        crime_data, validation_report = load_data_with_report(uploaded_file)
+    except ValueError as e:
+        st.error(f"Could not load file: {e}")
+        st.stop()
     
+    # Report rows that were skipped because of invalid or missing values
+    rejects = validation_report['rejects']
+    if len(rejects) > 0:
+        reasons = [f"{col} invalid ({count})" for col, count
+                   in validation_report['coercion_counts'].items() if count > 0]
+        reasons += [f"{col} missing ({count})" for col, count
+                    in validation_report['missing_counts'].items() if count > 0]
+        st.warning(
+            f"{len(rejects)} rows were skipped: "
+            + ", ".join(reasons)
+        )
+        st.sidebar.download_button(
+            "Download rejected rows",
+            data=rejects.to_csv(index=False),
+            file_name="rejected_rows.csv",
+            mime="text/csv"
+        )
+
+    if crime_data.empty:
+        st.error("No valid rows left to display.")
+        st.stop()
+
     # Add date filter
     st.sidebar.subheader("Date Filter")
     min_date = crime_data['OCCURRED_ON_DATE'].min().to_pydatetime()
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 from pandas.testing import assert_frame_equal
-from src.dashboard import load_data  
+from src.dashboard import load_data, load_data_with_report
 
 @pytest.fixture
 def sample_df():
@@ -45,14 +45,152 @@ def test_load_data_missing_file():
     assert load_data(None) is None
 
 
-def test_load_data_invalid_types(tmp_path):
-    df = pd.DataFrame({
-        "INCIDENT_NUMBER": [123],           # sollte str werden
-        "OFFENSE_CODE": ["abc"],            # sollte int werden → Fehler?
-        "DISTRICT": ["D4"],
-    })
+def test_load_data_invalid_types(tmp_path, sample_df):
+    sample_df["INCIDENT_NUMBER"] = [123, 124, 125]       # sollte str werden
+    sample_df["OFFENSE_CODE"] = ["abc", "102", "103"]    # kein int → reject
+    sample_df["DISTRICT"] = ["D4", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
     path = tmp_path / "bad.csv"
-    df.to_csv(path, index=False)
+    sample_df.to_csv(path, index=False)
 
-    with pytest.raises((ValueError, TypeError)):   # je nach pd.read_csv Verhalten
-        load_data(open(path, "rb"))
\ No newline at end of file
+    with open(path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert list(result["INCIDENT_NUMBER"]) == ["124", "125"]
+    assert result["OFFENSE_CODE"].dtype == "int64"
+    assert list(report["rejects"]["OFFENSE_CODE"]) == ["abc"]
+    assert list(report["rejects"]["REJECT_REASON"]) == ["OFFENSE_CODE"]
+
+
+def test_load_data_with_report_rejects_bad_rows(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
+    sample_df["OFFENSE_CODE"] = ["101", "abc", "103"]   # eine ungültige → reject
+    sample_df["Lat"] = ["42.3", "-1.0", "north"]        # eine ungültige → reject
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert list(result["INCIDENT_NUMBER"]) == ["I1"]
+    assert result["OFFENSE_CODE"].dtype == "int64"
+    assert report["coercion_counts"]["OFFENSE_CODE"] == 1
+    assert report["coercion_counts"]["Lat"] == 1
+    assert report["coercion_counts"]["HOUR"] == 0
+    rejects = report["rejects"]
+    assert list(rejects["INCIDENT_NUMBER"]) == ["I2", "I3"]
+    assert list(rejects["OFFENSE_CODE"]) == ["abc", "103"]   # Originalwerte bleiben
+    assert list(rejects["REJECT_REASON"]) == ["OFFENSE_CODE", "Lat"]
+
+
+def test_load_data_with_report_no_rejects(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert len(result) == 3
+    assert len(report["rejects"]) == 0
+    assert sum(report["coercion_counts"].values()) == 0
+    assert sum(report["missing_counts"].values()) == 0
+
+
+def test_load_data_with_report_missing_values(tmp_path, sample_df):
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert len(result) == 1
+    assert report["missing_counts"]["DISTRICT"] == 1
+    assert report["missing_counts"]["UCR_PART"] == 1
+    assert report["missing_counts"]["HOUR"] == 0
+    assert list(report["rejects"]["INCIDENT_NUMBER"]) == ["I2", "I3"]
+    assert list(report["rejects"]["REJECT_REASON"]) == ["DISTRICT missing", "UCR_PART missing"]
+
+
+def test_load_data_missing_columns(tmp_path, sample_df):
+    csv_path = tmp_path / "test.csv"
+    sample_df.drop(columns=["HOUR", "Lat"]).to_csv(csv_path, index=False)
+
+    with pytest.raises(ValueError, match="HOUR, Lat"):
+        load_data(open(csv_path, "rb"))
+
+
+def test_load_data_json(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", None, "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", ""]   # leer wie im CSV → reject
+    json_path = tmp_path / "test.json"
+    sample_df.to_json(json_path, orient="records")
+
+    with open(json_path, "rb") as f:
+        result = load_data(f)
+
+    assert len(result) == 1
+    assert result["HOUR"].dtype == "int64"
+
+
+def test_load_data_json_blank_strings(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "  ", "C11"]      # nur Leerzeichen → fehlt
+    json_path = tmp_path / "test.json"
+    sample_df.to_json(json_path, orient="records")   # "" bleibt im JSON erhalten
+
+    with open(json_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert list(result["INCIDENT_NUMBER"]) == ["I1"]
+    assert list(report["rejects"]["REJECT_REASON"]) == ["DISTRICT missing", "UCR_PART missing"]
+
+
+def test_load_data_mixed_date_formats(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
+    # erste Zeile mit anderem Format darf die übrigen nicht verwerfen
+    sample_df["OCCURRED_ON_DATE"] = ["01/15/2025 14:30", "2025-02-03 09:15", "2025-03-10 23:45"]
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert len(result) == 3
+    assert len(report["rejects"]) == 0
+    assert result["OCCURRED_ON_DATE"].iloc[0] == pd.Timestamp("2025-01-15 14:30")
+
+
+def test_load_data_date_with_offset(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
+    # eine Zeile mit Zeitzone → reject statt Abbruch
+    sample_df["OCCURRED_ON_DATE"] = ["2020-01-01 10:00", "2020-01-01 10:00+01:00", "2020-01-02 11:00"]
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert list(result["INCIDENT_NUMBER"]) == ["I1", "I3"]
+    assert result["OCCURRED_ON_DATE"].iloc[0] == pd.Timestamp("2020-01-01 10:00")
+    assert list(report["rejects"]["REJECT_REASON"]) == ["OCCURRED_ON_DATE"]
+    assert report["coercion_counts"]["OCCURRED_ON_DATE"] == 1
+
+
+def test_load_data_missing_int_value(tmp_path, sample_df):
+    sample_df["DISTRICT"] = ["A1", "B2", "C11"]
+    sample_df["UCR_PART"] = ["Part One", "Part Two", "Part Three"]
+    sample_df["HOUR"] = ["14", "", "7.5"]   # leer → missing, 7.5 → ungültig
+    csv_path = tmp_path / "test.csv"
+    sample_df.to_csv(csv_path, index=False)
+
+    with open(csv_path, "rb") as f:
+        result, report = load_data_with_report(f)
+
+    assert list(result["INCIDENT_NUMBER"]) == ["I1"]
+    assert report["missing_counts"]["HOUR"] == 1
+    assert report["coercion_counts"]["HOUR"] == 1
+    assert list(report["rejects"]["REJECT_REASON"]) == ["HOUR missing", "HOUR"]